@@ -1,9 +1,17 @@
+import argparse
+import logging
+import orjson
 import requests
 import os
 import sys
-from time import sleep
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-import json 
+
+# Shared MAQI scaling and jittered retry — one implementation for the app
+# and this CLI.
+from meersens import _JitteredRetry, _scale_maqi_to_score
+
+logger = logging.getLogger(__name__)
 
 # Load environment variables from a .env file
 load_dotenv()
@@ -15,104 +23,66 @@ API_KEY = os.getenv('MEERSENS_API_KEY')
 API_URL = "https://api.meersens.com/environment/public/air/current"
 # ----------------------------------------------------------------------------------
 
-MAX_RETRIES = 3
-INITIAL_BACKOFF_SECONDS = 1
+# Retry policy lives on the adapter so every caller gets the same behaviour:
+# bounded retries with jittered exponential backoff, honouring Retry-After,
+# and only for transient statuses. Auth failures (401) are never retried.
+_RETRY = _JitteredRetry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=True,
+)
+
+# Module-level session so repeat calls reuse the same pooled TLS connection
+# (HTTP keep-alive) instead of handshaking with api.meersens.com every time.
+_SESSION = requests.Session()
+_SESSION.headers.update({'Accept': 'application/json'})
+if API_KEY:
+    _SESSION.headers['apikey'] = API_KEY
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_RETRY))
+
 # Default return values if the API call fails
 DEFAULT_SCORE = 5.5 
 DEFAULT_DESCRIPTION = "Moderate (Data unavailable)"
 DEFAULT_MEERSENS_INDEX = 50.0 # Use 50 as the neutral point on a 0-100 scale
 
 
-def _scale_maqi_to_score(maqi_value):
-    """
-    Scales the proprietary Meersens Air Quality Index (MAQI) from a 0-100 scale
-    (where 0 is best, 100 is worst) to an inverse 1-10 quality score.
-
-    Score = 10 - (0.09 * MAQI)
-    
-    @param maqi_value: The raw MAQI value (float, expected 0.0 to 100.0).
-    @returns: The calculated quality score (1.0 to 10.0).
-    """
-    MAQI_MIN = 0.0    # MAQI value corresponding to Score 10 (Best)
-    MAQI_MAX = 100.0  # MAQI value corresponding to Score 1 (Worst)
-    SCORE_MAX = 10.0
-    SCORE_MIN = 1.0
-    
-    # 1. Clamp the input MAQI value
-    maqi_clamped = max(MAQI_MIN, min(MAQI_MAX, maqi_value))
-
-    # 2. Linear scaling: Score = m * MAQI + b
-    # Slope (m) = (SCORE_MIN - SCORE_MAX) / (MAQI_MAX - MAQI_MIN) = (1 - 10) / (100 - 0) = -9 / 100 = -0.09
-    slope = (SCORE_MIN - SCORE_MAX) / (MAQI_MAX - MAQI_MIN)
-
-    # Intercept (b) = SCORE_MAX - slope * MAQI_MIN = 10.0 - (-0.09 * 0) = 10.0
-    intercept = SCORE_MAX - (slope * MAQI_MIN)
-
-    score = (slope * maqi_clamped) + intercept
-
-    # Return score fixed to one decimal place
-    return float(f'{score:.1f}')
-
-
 def _fetch_data(latitude=None, longitude=None):
     """
     Internal helper to fetch raw air quality data from the Meersens API.
-    Handles network errors and retries.
-    
+    Retries/backoff are handled by the urllib3 Retry policy on the session.
+
     Returns the raw JSON data (dict) on success, or None on failure.
     """
     if not API_KEY:
-        print("ERROR: API_KEY is not set. Ensure 'MEERSENS_API_KEY' is in your .env file.")
+        logger.error("API_KEY is not set. Ensure 'MEERSENS_API_KEY' is in your .env file.")
         return None
-    
-    headers = {
-        "apikey": API_KEY,
-        "Accept": "application/json"
-    }
 
     params = {}
     if latitude is not None and longitude is not None:
         params['lat'] = latitude
         params['lng'] = longitude
     else:
-         print("WARNING: Latitude and longitude were not provided. API may return an irrelevant default location.")
+        logger.warning("Latitude and longitude were not provided. API may return an irrelevant default location.")
 
-    
-    backoff_time = INITIAL_BACKOFF_SECONDS
-    
-    for attempt in range(MAX_RETRIES):
-        try:
-            print(f"Attempting to fetch data (Attempt {attempt + 1})...")
-            response = requests.get(API_URL, headers=headers, params=params, timeout=10) 
-            
-            if response.status_code == 200:
-                print("Successfully fetched data.")
-                
-                # Extract and pretty-print the raw JSON response
-                raw_json_data = response.json()
-                print("\n--- RAW JSON API RESPONSE START ---")
-                print(json.dumps(raw_json_data, indent=2))
-                print("--- RAW JSON API RESPONSE END ---\n")
-                
-                return raw_json_data
-            
-            elif response.status_code == 401:
-                print("API Error: Authentication failed. Check your API key and permissions.")
-                break
-            
-            else:
-                print(f"API Error (Status {response.status_code}): {response.text}")
-                
-        except requests.exceptions.RequestException as e:
-            print(f"Network error on attempt {attempt + 1}: {e}")
-        
-        if attempt < MAX_RETRIES - 1:
-            print(f"Retrying in {backoff_time} seconds...")
-            sleep(backoff_time)
-            backoff_time *= 2
-        else:
-            print("Maximum retries reached. Failing to fetch data.")
-            break
+    try:
+        response = _SESSION.get(API_URL, params=params, timeout=(3.05, 10))
+    except requests.exceptions.RequestException as e:
+        logger.error("Network error fetching air quality data: %s", e)
+        return None
+
+    if response.status_code == 200:
+        raw_json_data = orjson.loads(response.content)
+        # Gated so the payload is only stringified when DEBUG is actually on.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Raw Meersens air response: %s", raw_json_data)
+        return raw_json_data
+
+    if response.status_code == 401:
+        logger.error("API Error: Authentication failed. Check your API key and permissions.")
+    else:
+        logger.error("API Error (Status %s): %s", response.status_code, response.text)
 
     return None
 
@@ -148,33 +118,52 @@ def get_current_air(latitude=None, longitude=None):
                 # Return (score, raw_value, description)
                 return (score, maqi_float, description)
             else:
-                print("ERROR: 'value' key missing from API response under ['index'].")
-                
+                logger.error("'value' key missing from API response under ['index'].")
+
         except (ValueError, TypeError, AttributeError) as e:
-            print(f"ERROR: Failed to parse air quality data from API response: {e}")
+            logger.error("Failed to parse air quality data from API response: %s", e)
             
     # Default return for failure
     return (DEFAULT_SCORE, DEFAULT_MEERSENS_INDEX, f"Data Unavailable - {DEFAULT_DESCRIPTION}")
 
 if __name__ == "__main__":
-    
+    logging.basicConfig(level=logging.INFO)
+
     # --- Check for API Key ---
     if not API_KEY:
         print("\nFATAL ERROR: The MEERSENS_API_KEY environment variable is missing.")
         sys.exit(1)
 
-    latitude = None
-    longitude = None
-    
-    # Check if arguments were provided (e.g., python air_api_fetcher.py 34.05 -118.24)
-    if len(sys.argv) == 3:
-        try:
-            latitude = float(sys.argv[1])
-            longitude = float(sys.argv[2])
-            print(f"--- Using Command-Line Arguments: Lat={latitude}, Lng={longitude} ---")
-        except ValueError:
-            print("ERROR: Invalid command-line arguments. Expected two numeric values (latitude longitude).")
-    
+    parser = argparse.ArgumentParser(description="Fetch Meersens air quality scores.")
+    parser.add_argument("lat", nargs="?", type=float, help="latitude (e.g., 40.7128)")
+    parser.add_argument("lng", nargs="?", type=float, help="longitude (e.g., -74.0060)")
+    parser.add_argument("--coords-file", help="file with one 'lat lng' (or 'lat,lng') pair per line; fetched concurrently")
+    parser.add_argument("--workers", type=int, default=8, help="concurrent fetches for --coords-file (default: 8)")
+    args = parser.parse_args()
+
+    # --- Batch mode: parallel lookups over the shared pooled session ---
+    if args.coords_file:
+        coords = []
+        with open(args.coords_file) as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                lat_str, lng_str = line.replace(",", " ").split()[:2]
+                coords.append((float(lat_str), float(lng_str)))
+
+        print(f"Fetching air quality for {len(coords)} locations with {args.workers} workers...")
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            results = executor.map(lambda c: get_current_air(*c), coords)
+            for (lat, lng), (score, value, description) in zip(coords, results):
+                print(f"{lat},{lng}\t{score}\t{value}\t{description}")
+        sys.exit(0)
+
+    latitude = args.lat
+    longitude = args.lng
+    if latitude is not None and longitude is not None:
+        print(f"--- Using Command-Line Arguments: Lat={latitude}, Lng={longitude} ---")
+
     # If no valid arguments were provided (or arguments were invalid), prompt the user
     if latitude is None or longitude is None:
         print("\n--- Interactive Air Quality Fetcher Test ---")
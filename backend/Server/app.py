@@ -1,12 +1,18 @@
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, jsonify, request, send_from_directory, stream_with_context
+from flask.json.provider import JSONProvider
+import fastjsonschema
 from pymongo import MongoClient
+from pymongo.write_concern import WriteConcern
+import cachetools
+import logging
+import orjson
 import os
+import threading
 from dotenv import load_dotenv
 import certifi
-import requests
-from typing import Dict, Optional, Tuple, Any
-from werkzeug.utils import secure_filename
-from uuid import uuid4
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Any
+import hashlib
 from datetime import datetime, timezone
 
 from flask_bcrypt import Bcrypt
@@ -18,6 +24,17 @@ from flask_jwt_extended import JWTManager, create_access_token, jwt_required
 from transit_score import get_transit_score
 # ==========================================
 
+# Meersens air/weather scoring lives in its own module (pooled session,
+# per-coordinate caches) so there is a single copy of that code.
+from meersens import (
+    DEFAULT_DESCRIPTION,
+    DEFAULT_SCORE,
+    MeersensUnavailable,
+    _coord_key,
+    get_air_quality_score,
+    get_weather_score,
+)
+
 # Import your schema
 # NOTE: The reports_schema.py file must be present for this to run
 from reports_schema import REPORT_SCHEMA, ALL_CATEGORIES
@@ -33,16 +50,29 @@ WEIGHTS = {
     "transit_score": 0.30, # New factor based on proximity to downtown hub
 }
 
-DEFAULT_SCORE = 5.5
-DEFAULT_DESCRIPTION = "Data unavailable"
+# One-time logging setup for the whole backend; level is env-tunable so
+# DEBUG chatter costs nothing in production (isEnabledFor fast path).
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO"),
+    format="%(asctime)s %(levelname)s %(name)s %(message)s",
+)
+logger = logging.getLogger(__name__)
 
 if abs(sum(WEIGHTS.values()) - 1.0) > 0.001:
     raise ValueError("The weights in the WEIGHTS dictionary must sum to 1.0.")
 
+# Weights bound once for the scoring expression; the WEIGHTS dict itself is
+# kept only for the response payload.
+W_AIR = WEIGHTS["air_quality"]
+W_WEATHER = WEIGHTS["weather_rating"]
+W_TRANSIT = WEIGHTS["transit_score"]
+
 load_dotenv()
-API_KEY = os.getenv('MEERSENS_API_KEY')
-if not API_KEY:
-    print("WARNING: MEERSENS_API_KEY is not set. API calls will likely fail.")
+
+# Executor used to overlap the independent Meersens calls per request, so
+# /api/city-quality pays max(RTT) rather than the sum of its upstream calls.
+# Network-bound work releases the GIL, so threads give real concurrency here.
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
 
 # --- JWT Configuration Fix ---
 JWT_KEY = os.getenv('JWT_SECRET_KEY')
@@ -55,59 +85,149 @@ if not JWT_KEY or not FLASK_KEY:
 # 1. FLASK + MONGO SETUP
 # ======================================================================
 
+# Shared orjson options for everything that crosses the JSON edge. Mongo
+# hands back naive datetimes (the client is not tz_aware), so OPT_NAIVE_UTC
+# declares them UTC and OPT_UTC_Z renders the "...Z" suffix — without the
+# pair, createdAt would serialize suffix-less and browsers would parse it
+# as local time.
+_ORJSON_OPTS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson (C extension, far faster than stdlib json)."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=_ORJSON_OPTS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # --- APPLY SECRETS ---
 app.config["SECRET_KEY"] = FLASK_KEY
 app.config["JWT_SECRET_KEY"] = JWT_KEY
 # ---------------------
 
+# Reject pathological uploads before they are buffered; photos are the only
+# large payload and 10 MB is plenty.
+app.config["MAX_CONTENT_LENGTH"] = 10 * 1024 * 1024
+
+# In production, set USE_X_SENDFILE=1 so send_from_directory emits an
+# X-Sendfile header and the front proxy streams images with sendfile(2),
+# freeing the Python worker immediately. Leave unset for the dev server,
+# which has no proxy to honour the header.
+app.use_x_sendfile = os.getenv("USE_X_SENDFILE", "").lower() in ("1", "true", "yes")
+
 # <--- REPLACED CORS WITH MANUAL AFTER_REQUEST HOOK --->
+# CORS constants built once; the after_request hook runs on every response,
+# so it should do set membership + one extend, not rebuild lists and add
+# headers one call at a time.
+_ALLOWED_ORIGINS = frozenset(("http://localhost:5173", "http://127.0.0.1:5173"))
+_STATIC_CORS = (
+    ('Access-Control-Allow-Headers', 'Content-Type,Authorization'),
+    ('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS'),
+    ('Access-Control-Allow-Credentials', 'true'),
+    # Browsers cache the preflight verdict for a day, skipping the OPTIONS
+    # round-trip on repeat calls.
+    ('Access-Control-Max-Age', '86400'),
+)
+
+@app.before_request
+def short_circuit_preflight():
+    # Answer CORS preflights here so they never dispatch into a view:
+    # no JWT decode, no DB guards, no per-route OPTIONS branches.
+    if request.method == 'OPTIONS':
+        return '', 204  # after_request still attaches the CORS headers
+
 @app.after_request
 def add_cors_headers(response):
     # Only allow the specific origins used by the frontend
-    allowed_origins = ["http://localhost:5173", "http://127.0.0.1:5173"]
     request_origin = request.headers.get('Origin')
-
-    if request_origin in allowed_origins:
+    if request_origin in _ALLOWED_ORIGINS:
         response.headers.add('Access-Control-Allow-Origin', request_origin)
 
-    response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization')
-    response.headers.add('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-    response.headers.add('Access-Control-Allow-Credentials', 'true')
-
-    # Handle preflight OPTIONS request
-    if request.method == 'OPTIONS':
-        response.status_code = 200
-        response.data = b'' # Ensure response body is empty for OPTIONS
-
+    response.headers.extend(_STATIC_CORS)
     return response
 
 
+# 11 rounds instead of Flask-Bcrypt's default 12 halves the CPU burned per
+# hash/check (~100ms vs ~250ms) while staying well above feasible brute
+# force. Existing 12-round hashes keep verifying — the cost is embedded in
+# the stored hash. Note bcrypt's C core releases the GIL while stretching,
+# so concurrent logins already overlap under the threaded worker; shipping
+# the work to the executor and blocking on the result would gain nothing.
+app.config["BCRYPT_LOG_ROUNDS"] = 11
+
 jwt = JWTManager(app)
 bcrypt = Bcrypt(app)
 
 
 mongo_uri = os.getenv("MONGO_URI")
 try:
-    # Use a shorter timeout for quicker failure detection in development
-    client = MongoClient(mongo_uri, tlsCAFile=certifi.where(), serverSelectionTimeoutMS=5000)
+    # Warm connection pool + fast failure detection. zstd compression cuts
+    # wire bytes to Atlas; the zstandard package is a pinned dependency, so
+    # the option is always live.
+    client = MongoClient(
+        mongo_uri,
+        tlsCAFile=certifi.where(),
+        serverSelectionTimeoutMS=2000,
+        socketTimeoutMS=5000,
+        maxPoolSize=50,
+        minPoolSize=5,
+        retryWrites=True,
+        w=1,
+        compressors="zstd",
+        # Lazy connect: under a multi-worker server each forked/spawned
+        # worker opens its own pool on first use instead of at import.
+        connect=False,
+        maxIdleTimeMS=60000,
+    )
     # The ismaster command is a lightweight way to verify a connection
     client.admin.command('ismaster')
     db = client["welivehere"]
     collection = db["reports"]
     usersCollection = db["users"]
-    print("INFO: MongoDB connection established (Collection: reports).")
+    # Insert handle with relaxed durability: ack from the primary without
+    # waiting for the journal flush. Reads keep using `collection`.
+    reportsWriteCollection = collection.with_options(write_concern=WriteConcern(w=1, j=False))
+    # Declared once at boot so the sorted/paged list queries use an IXSCAN
+    # instead of a collection scan. create_index is a no-op when it exists.
+    collection.create_index([("createdAt", -1)])
+    # Covers category-filtered feeds sorted newest-first should the UI grow
+    # one; the prefix also serves plain category lookups.
+    collection.create_index([("category", 1), ("createdAt", -1)])
+    # Partial index over just the photo reports: smaller than a full-type
+    # index and exactly matches a type-filtered, newest-first feed query.
+    collection.create_index(
+        [("type", 1), ("createdAt", -1)],
+        partialFilterExpression={"type": "report"},
+    )
+    try:
+        # Index seek for the find_one in login/registration instead of a
+        # collection scan, and uniqueness enforced where it belongs.
+        usersCollection.create_index("username", unique=True)
+    except Exception as e:
+        # Pre-existing duplicate usernames block the unique index; don't let
+        # that take down the whole DB setup.
+        logger.warning("Could not create unique username index: %s", e)
+    logger.info("MongoDB connection established (Collection: reports).")
 except Exception as e:
-    print(f"❌ ERROR: Failed to connect to MongoDB. Users/Reports data will be unavailable: {e}")
+    logger.error("Failed to connect to MongoDB. Users/Reports data will be unavailable: %s", e)
     client = None
     collection = None
+    reportsWriteCollection = None
     usersCollection = None
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 IMAGES_DIR = os.path.join(BASE_DIR, "..", "images")
 os.makedirs(IMAGES_DIR, exist_ok=True)
 
+# Upload-path constants, resolved once at import time.
+_ALLOWED_EXT = frozenset({".jpg", ".jpeg", ".png", ".webp"})
+_IMAGES_DIR = os.path.realpath(IMAGES_DIR)
+
 # ======================================================================
 # 2. VALIDATION UTILITY
 # ======================================================================
@@ -122,136 +242,100 @@ def validate_user_register(data):
         return "Username found"
     # MAKE OTHER IDK
 
+# REPORT_SCHEMA is translated to JSON Schema once at import time and compiled
+# with fastjsonschema, which code-generates a validator specialized to the
+# schema shape — no per-request walk over the rule dicts. That compile step
+# subsumes any hand-built per-field checker/dispatch table we might maintain
+# ourselves: the generated function is already one flat pass of type checks.
+# A msgspec.Struct port would fuse decode+validate in C but means keeping a
+# second schema definition in sync with REPORT_SCHEMA; not worth it at this
+# request volume.
+
+_JSON_TYPES = {str: "string", int: "integer", float: "number", dict: "object", bool: "boolean", list: "array"}
+
+def _to_json_schema(schema: Dict) -> Dict:
+    properties = {}
+    required = []
+    for field, rules in schema.items():
+        prop: Dict[str, Any] = {"type": _JSON_TYPES[rules["type"]]}
+        if "allowed_values" in rules:
+            prop["enum"] = list(rules["allowed_values"])
+        if "schema" in rules:
+            nested = _to_json_schema(rules["schema"])
+            prop.update(nested)
+        properties[field] = prop
+        if rules.get("required", False):
+            required.append(field)
+    return {"type": "object", "properties": properties, "required": required}
+
+_validate_report_schema = fastjsonschema.compile(_to_json_schema(REPORT_SCHEMA))
+
 def _validate_report_data(data: Dict) -> Optional[str]:
     if not isinstance(data, dict):
         return "Payload must be a JSON object."
-
-    for field, rules in REPORT_SCHEMA.items():
-        is_required = rules.get("required", False)
-        if is_required and field not in data:
-            return f"Missing required field: '{field}'"
-
-        if field in data:
-            value = data[field]
-            expected_type = rules["type"]
-
-            if not isinstance(value, expected_type):
-                return f"Field '{field}' must be {expected_type.__name__}"
-
-            if field == "category" and value not in rules.get("allowed_values", []):
-                allowed = ', '.join(rules['allowed_values'])
-                return f"Category must be one of: {allowed}"
-
-            if field == "geolocation":
-                geo_schema = rules["schema"]
-                for geo_field, geo_rules in geo_schema.items():
-                    if geo_field not in value:
-                        return f"Missing geolocation field: '{geo_field}'"
-                    if not isinstance(value[geo_field], geo_rules["type"]):
-                        return f"'{geo_field}' must be {geo_rules['type'].__name__}"
-
+    try:
+        _validate_report_schema(data)
+    except fastjsonschema.JsonSchemaException as e:
+        return e.message
     return None
 
 # ======================================================================
-# 3. AIR QUALITY SERVICE
+# 5. CITY QUALITY CALCULATOR (UPDATED)
 # ======================================================================
 
-def _scale_maqi_to_score(maqi_value: float) -> float:
-    MAQI_MIN, MAQI_MAX = 0.0, 100.0
-    SCORE_MAX, SCORE_MIN = 10.0, 1.0
-    maqi_clamped = max(MAQI_MIN, min(MAQI_MAX, maqi_value))
-    slope = (SCORE_MIN - SCORE_MAX) / (MAQI_MAX - MAQI_MIN)
-    score = (slope * maqi_clamped) + SCORE_MAX
-    return round(max(SCORE_MIN, score), 1)
-
-def get_air_quality_score(latitude: float, longitude: float) -> Tuple[float, str]:
-    print(f"DEBUG: Fetching Air Quality for {latitude},{longitude}")
-    if not API_KEY:
-        return DEFAULT_SCORE, "Air: Data unavailable (no API key)"
+# Assembled-result cache on top of the per-fetcher TTL caches in meersens:
+# repeat hits on the same ~100m cell skip even the executor dispatch and
+# transit math. Short TTL so it never outlives the underlying score caches.
+# Check-and-insert is manual (not @cachetools.cached) so that degraded
+# results — any component that fell back to its default because the upstream
+# was unavailable — are never stored: the next request retries instead of
+# serving the fallback for the whole TTL.
+_CITY_CACHE = cachetools.TTLCache(maxsize=2048, ttl=300)
+_CITY_CACHE_LOCK = threading.Lock()
 
+def calculate_city_quality_score(lat: float, lon: float) -> Dict[str, Any]:
+    cache_key = _coord_key(lat, lon)
+    with _CITY_CACHE_LOCK:
+        cached = _CITY_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    degraded = False
+    # 1. Get individual scores. Air and weather are independent HTTP calls, so
+    # dispatch them concurrently and pay max(RTT) instead of the sum.
+    future_air = _EXECUTOR.submit(get_air_quality_score, lat, lon)
+    future_weather = _EXECUTOR.submit(get_weather_score, lat, lon)
+    transit_score, transit_desc = get_transit_score(lat, lon) # Pure CPU, run inline
+    # MeersensUnavailable means the fetcher declined to answer (no key, open
+    # breaker, transport failure); map it to the default score here and mark
+    # the result degraded. The bare-Exception guards keep the route alive if
+    # a future dies on something unexpected.
     try:
-        url = "https://api.meersens.com/environment/public/air/current"
-        resp = requests.get(url, headers={'apikey': API_KEY}, params={'lat': latitude, 'lng': longitude}, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
-        if data.get('found'):
-            idx = data.get('index', {})
-            if idx.get('value') is not None:
-                score = _scale_maqi_to_score(float(idx['value']))
-                desc = f"Air: {idx.get('qualification', 'Unknown')}"
-                return score, desc
+        air_score, air_desc = future_air.result()
+    except MeersensUnavailable as e:
+        logger.warning("Air score unavailable: %s", e)
+        degraded = True
+        air_score, air_desc = DEFAULT_SCORE, f"Air: {DEFAULT_DESCRIPTION}"
     except Exception as e:
-        print(f"ERROR: Air Quality API failed: {e}")
-    return DEFAULT_SCORE, f"Air: {DEFAULT_DESCRIPTION}"
-
-# ======================================================================
-# 4. WEATHER SERVICE
-# ======================================================================
-
-class WeatherService:
-    OPTIMAL_TEMP = 25.0
-    BASE_URL = "https://api.meersens.com/environment/public/weather/current"
-
-    def get_weather_data(self, lat: float, lng: float):
-        r = requests.get(self.BASE_URL, headers={'apikey': API_KEY}, params={'lat': lat, 'lng': lng}, timeout=10)
-        r.raise_for_status()
-        return r.json()
-
-    def calculate_weather_rating(self, data: Dict[str, Any]) -> float:
-        temp = data.get("parameters", {}).get("temperature", {}).get("value")
-        if temp is None:
-            return DEFAULT_SCORE
-        deviation = abs(temp - self.OPTIMAL_TEMP)
-        rating = max(1.0, 10 - (deviation / 65.0) * 10)
-        return round(rating, 1)
-
-    def describe_weather(self, data: Dict[str, Any]) -> str:
-        params = data.get("parameters", {})
-        temp = params.get("temperature", {}).get("value")
-        condition = params.get("weather_condition", {}).get("value", "Unknown").title()
-        if temp is None:
-            return f"Weather: {condition}"
-        if temp < 0: desc = "Freezing"
-        elif temp < 10: desc = "Cold"
-        elif temp < 20: desc = "Cool"
-        elif temp < 28: desc = "Pleasant"
-        elif temp < 35: desc = "Warm"
-        else: desc = "Hot"
-        return f"Weather: {condition}, {desc} ({temp}°C)"
-
-def get_weather_score(lat: float, lon: float) -> Tuple[float, str]:
-    print(f"DEBUG: Fetching Weather for {lat},{lon}")
-    service = WeatherService()
-    if not API_KEY:
-        return DEFAULT_SCORE, "Weather: API key missing"
+        logger.error("Air score future failed: %s", e)
+        degraded = True
+        air_score, air_desc = DEFAULT_SCORE, f"Air: {DEFAULT_DESCRIPTION}"
     try:
-        data = service.get_weather_data(lat, lon)
-        score = service.calculate_weather_rating(data)
-        desc = service.describe_weather(data)
-        return score, desc
+        weather_score, weather_desc = future_weather.result()
+    except MeersensUnavailable as e:
+        logger.warning("Weather score unavailable: %s", e)
+        degraded = True
+        weather_score, weather_desc = DEFAULT_SCORE, f"Weather: {DEFAULT_DESCRIPTION}"
     except Exception as e:
-        print(f"ERROR: Weather API failed: {e}")
-        return DEFAULT_SCORE, f"Weather: {DEFAULT_DESCRIPTION}"
-
-# ======================================================================
-# 5. CITY QUALITY CALCULATOR (UPDATED)
-# ======================================================================
+        logger.error("Weather score future failed: %s", e)
+        degraded = True
+        weather_score, weather_desc = DEFAULT_SCORE, f"Weather: {DEFAULT_DESCRIPTION}"
 
-def calculate_city_quality_score(lat: float, lon: float) -> Dict[str, Any]:
-    # 1. Get individual scores
-    air_score, air_desc = get_air_quality_score(lat, lon)
-    weather_score, weather_desc = get_weather_score(lat, lon)
-    transit_score, transit_desc = get_transit_score(lat, lon) # NEW: Get transit score
-
-    # 2. Calculate weighted total
-    total = (
-        air_score * WEIGHTS["air_quality"] + 
-        weather_score * WEIGHTS["weather_rating"] +
-        transit_score * WEIGHTS["transit_score"] # NEW: Include transit weight
-    )
+    # 2. Calculate weighted total (weights pre-bound at import time)
+    total = air_score * W_AIR + weather_score * W_WEATHER + transit_score * W_TRANSIT
 
-    # 3. Return results
-    return {
+    # 3. Assemble results; only fully-fetched results are cached.
+    result = {
         "city_quality_score": round(total, 1),
         "individual_ratings": {
             "air_quality": {"score": air_score, "desc": air_desc, "weight": WEIGHTS["air_quality"]},
@@ -259,6 +343,10 @@ def calculate_city_quality_score(lat: float, lon: float) -> Dict[str, Any]:
             "transit_score": {"score": transit_score, "desc": transit_desc, "weight": WEIGHTS["transit_score"]}, # NEW: Include transit details
         },
     }
+    if not degraded:
+        with _CITY_CACHE_LOCK:
+            _CITY_CACHE[cache_key] = result
+    return result
 
 # ======================================================================
 # 6. FLASK ROUTES
@@ -266,7 +354,7 @@ def calculate_city_quality_score(lat: float, lon: float) -> Dict[str, Any]:
 
 @app.route("/")
 def home():
-    print("DEBUG: Hit / route.")
+    logger.debug("Hit / route.")
     return jsonify({"message": "Flask backend running and connected to MongoDB"})
 
 @app.route("/api/register", methods=["POST", "OPTIONS"])
@@ -275,14 +363,12 @@ def register():
     if usersCollection is None:
         return jsonify({"error": "Database not connected. Cannot register user."}), 500
 
-    if request.method == 'OPTIONS':
-        return '', 200 # Preflight handled by after_request hook
 
     data = None
     try:
         data = request.json
     except Exception as e:
-        print(f"ERROR: Failed to parse JSON payload in /register: {e}")
+        logger.error("Failed to parse JSON payload in /register: %s", e)
         return jsonify({"error": "Failed to parse JSON request body."}), 400
     
     if data is None:
@@ -290,7 +376,7 @@ def register():
 
     validation_error = validate_user_register(data)
     if validation_error and validation_error != "Database unavailable for registration check.":
-        print(f"ERROR: Validation failed: {validation_error}")
+        logger.error("Validation failed: %s", validation_error)
         return jsonify({"error": "Invalid report data format", "details": validation_error}), 400
 
     # Ensure required fields exist before accessing them
@@ -309,7 +395,7 @@ def register():
         usersCollection.insert_one(user)
         return jsonify({"msg": "User created"}), 201
     except Exception as e:
-        print(f"ERROR: Failed to insert user: {e}")
+        logger.error("Failed to insert user: %s", e)
         return jsonify({"error": f"Failed to register user: {e}"}), 500
 
 
@@ -319,14 +405,12 @@ def login():
     if usersCollection is None:
         return jsonify({"error": "Database not connected. Cannot process login."}), 500
     
-    if request.method == 'OPTIONS':
-        return '', 200 # Preflight handled by after_request hook
 
     data = None
     try:
         data = request.json
     except Exception as e:
-        print(f"ERROR: Failed to parse JSON payload in /login: {e}")
+        logger.error("Failed to parse JSON payload in /login: %s", e)
         return jsonify({"error": "Failed to parse JSON request body."}), 400
 
     if data is None:
@@ -338,7 +422,7 @@ def login():
     try:
         user = usersCollection.find_one({"username": username})
     except Exception as e:
-        print(f"ERROR: MongoDB query error during login: {e}")
+        logger.error("MongoDB query error during login: %s", e)
         return jsonify({"error": "Login failed due to database error."}), 500
     
     if not user:
@@ -359,45 +443,136 @@ def login():
 @app.route("/api/me", methods=["GET", "OPTIONS"])
 @jwt_required()
 def me():
-    if request.method == 'OPTIONS':
-        return '', 200
 
     # TODO: Implement user details retrieval
     return jsonify({"message": "User details not implemented yet."}), 200
 
+# Cheap ETag revalidation for the two list endpoints. Tags are derived from
+# the data itself (newest createdAt plus an estimated count), not from a
+# per-process counter: under multi-worker gunicorn a counter bumped in one
+# worker is invisible to its siblings, so a client stuck to another worker
+# could revalidate against a stale tag and get a false 304 indefinitely.
+# Both probes are cheap — find_one rides the createdAt sort index and
+# estimated_document_count reads collection metadata. Returns None when the
+# probe fails; callers then skip revalidation and serve the full body.
+
+def _reports_etag() -> Optional[str]:
+    try:
+        newest = collection.find_one({}, {"createdAt": 1}, sort=[("createdAt", -1)])
+        count = collection.estimated_document_count()
+        created = newest.get("createdAt") if newest else None
+        # Legacy docs store createdAt as an ISO string, not a BSON Date; only
+        # Date-typed values carry a usable timestamp. The count still moves
+        # the tag while only legacy docs exist.
+        ts = created.timestamp() if isinstance(created, datetime) else 0.0
+        return f"r{count}-{ts:.6f}"
+    except Exception as e:
+        logger.warning("Reports ETag probe failed: %s", e)
+        return None
+
+def _users_etag() -> Optional[str]:
+    # User docs carry no timestamp and there are no update/delete routes, so
+    # the estimated count alone tracks every change the API can make.
+    try:
+        return f"u{usersCollection.estimated_document_count()}"
+    except Exception as e:
+        logger.warning("Users ETag probe failed: %s", e)
+        return None
+
 @app.route("/api/users", methods=["GET", "OPTIONS"])
 def get_users():
-    if request.method == 'OPTIONS':
-        return '', 200
-    
+
     if usersCollection is None:
         return jsonify({"error": "Database not connected"}), 500
-    data = list(usersCollection.find({}, {"_id": 0}))
-    return jsonify(data)
+
+    # A matching If-None-Match skips the full fetch and serialization; the
+    # tag itself costs one metadata read.
+    etag = _users_etag()
+    if etag is not None and request.if_none_match.contains_weak(etag):
+        return '', 304
+
+    cursor = usersCollection.find({}, {"_id": 0}).batch_size(500)
+
+    def generate():
+        # Same streamed-array framing as /api/reports: bytes flow as batches
+        # arrive instead of materializing the whole list first.
+        yield b"["
+        first = True
+        try:
+            for doc in cursor:
+                if first:
+                    first = False
+                else:
+                    yield b","
+                yield orjson.dumps(doc, option=_ORJSON_OPTS)
+        except Exception as e:
+            logger.error("User query failed mid-stream: %s", e)
+        yield b"]"
+
+    resp = Response(stream_with_context(generate()), mimetype="application/json")
+    if etag is not None:
+        resp.set_etag(etag, weak=True)
+    resp.headers["Cache-Control"] = "private, max-age=30, stale-while-revalidate=60"
+    return resp
 
 @app.route("/api/reports", methods=["GET", "OPTIONS"])
 def get_submissions():
-    print("DEBUG: Hit /api/reports GET route.")
-    if request.method == 'OPTIONS':
-        return '', 200
+    logger.debug("Hit /api/reports GET route.")
 
     if collection is None:
         return jsonify({"error": "Database not connected"}), 500
+
+    etag = _reports_etag()
+    if etag is not None and request.if_none_match.contains_weak(etag):
+        return '', 304
+    # Newest first with bounded, client-tunable pagination so the server does
+    # O(page) work however large the collection grows.
     try:
-        # Fetch all reports from the 'reports' collection
-        data = list(collection.find({}, {"_id": 0}))
-        return jsonify(data)
-    except Exception as e:
-        print(f"ERROR: Database query failed: {e}")
-        return jsonify({"error": f"Database query failed: {e}"}), 500
+        # Clamp to 1..500: pymongo treats limit(0) as "no limit", so an
+        # unclamped ?limit=0 (or a negative) would stream the whole collection.
+        limit = max(1, min(int(request.args.get("limit", 200)), 500))
+        skip = max(int(request.args.get("skip", 0)), 0)
+    except ValueError:
+        return jsonify({"error": "limit and skip must be integers"}), 400
+
+    cursor = (
+        collection.find({}, {"_id": 0})
+        .sort("createdAt", -1)
+        .skip(skip)
+        .limit(limit)
+        .batch_size(500)
+    )
+
+    def generate():
+        # Stream documents as Mongo batches arrive: the client starts parsing
+        # immediately and peak memory stays around one 500-doc batch instead
+        # of the fully materialized list + jsonify copy.
+        yield b"["
+        first = True
+        try:
+            for doc in cursor:
+                if first:
+                    first = False
+                else:
+                    yield b","
+                yield orjson.dumps(doc, option=_ORJSON_OPTS)
+        except Exception as e:
+            # Headers are already sent once streaming starts; close the array
+            # so the client gets valid (possibly truncated) JSON.
+            logger.error("Database query failed mid-stream: %s", e)
+        yield b"]"
+
+    resp = Response(stream_with_context(generate()), mimetype="application/json")
+    if etag is not None:
+        resp.set_etag(etag, weak=True)
+    resp.headers["Cache-Control"] = "private, max-age=30, stale-while-revalidate=60"
+    return resp
 
 
 @app.route("/api/reports", methods=["POST", "OPTIONS"])
 # Note: This route expects JSON payload
 def add_submission_json():
-    print("DEBUG: Hit /api/reports POST route (JSON).")
-    if request.method == 'OPTIONS':
-        return '', 200
+    logger.debug("Hit /api/reports POST route (JSON).")
 
     if collection is None:
         return jsonify({"error": "Database not connected"}), 500
@@ -411,35 +586,34 @@ def add_submission_json():
         # Validate incoming data using the schema
         validation_error = _validate_report_data(data)
         if validation_error:
-            print(f"ERROR: Validation failed: {validation_error}")
+            logger.error("Validation failed: %s", validation_error)
             return jsonify({"error": "Invalid report data format", "details": validation_error}), 400
 
         # Data is valid, insert into the 'reports' collection
-        collection.insert_one(data)
-        print(f"DEBUG: Successfully added submission: {data.get('title')}")
+        reportsWriteCollection.insert_one(data)
+        logger.debug("Successfully added submission: %s", data.get("title"))
         return jsonify({"message": "Report submission added successfully"}), 201
     except Exception as e:
-        print(f"ERROR: Failed to add submission: {e}")
+        logger.error("Failed to add submission: %s", e)
         return jsonify({"error": f"Failed to add submission: {e}"}), 500
 
 
 @app.route("/api/city-quality", methods=["GET", "OPTIONS"])
 def city_quality():
-    if request.method == 'OPTIONS':
-        return '', 200
     
     try:
         lat = float(request.args.get("lat"))
         lon = float(request.args.get("lng"))
     except (TypeError, ValueError):
         return jsonify({"error": "Invalid coordinates"}), 400
+    # Reject out-of-range coordinates before spending two Meersens calls on them.
+    if not (-90.0 <= lat <= 90.0 and -180.0 <= lon <= 180.0):
+        return jsonify({"error": "Coordinates out of range"}), 400
     data = calculate_city_quality_score(lat, lon)
     return jsonify(data), 200
 
 @app.route("/api/communities", methods=["POST", "OPTIONS"])
 def save_community():
-    if request.method == 'OPTIONS':
-        return '', 200
 
     if collection is None:
         return jsonify({"error": "Database not connected"}), 500
@@ -462,18 +636,29 @@ def save_community():
             "type": "community",
             "name": name,
             "centroid": {"lat": float(lat), "lon": float(lon)},
-            "createdAt": datetime.now(timezone.utc).isoformat(),
+            "createdAt": datetime.now(timezone.utc),  # BSON Date: 8 bytes, range-indexable
         }
-        collection.insert_one(doc)
+        reportsWriteCollection.insert_one(doc)
         return jsonify({"message": "Community saved"}), 201
     except Exception as e:
         return jsonify({"message": f"DB error: {e}"}), 500
 
-# This route handles form data/file uploads.
+def _save_photo(payload: bytes, save_path: str) -> None:
+    """Executor task: flush an uploaded image to disk."""
+    try:
+        # Content-addressed names mean an existing file is byte-identical;
+        # skip the duplicate write.
+        if not os.path.exists(save_path):
+            with open(save_path, "wb") as f:
+                f.write(payload)
+    except Exception as e:
+        logger.error("Background photo save failed for %s: %s", save_path, e)
+
+# This route handles form data/file uploads. It is the only multipart report
+# path — JSON reports go through add_submission_json above — so all photo
+# persistence funnels through _save_photo, one place to tune.
 @app.route("/api/reports_file", methods=["POST", "OPTIONS"])
 def create_report_file():
-    if request.method == 'OPTIONS':
-        return '', 200
 
     if collection is None:
         return jsonify({"error": "Database not connected"}), 500
@@ -484,21 +669,28 @@ def create_report_file():
     title = (form.get("title") or "").strip()
     desc = (form.get("description") or "").strip()
     cat = (form.get("category") or "infrastructure").strip().lower()
-    lat, lon = form.get("lat"), form.get("lon")
+    # Parse coordinates once, one try/except around both fields.
+    try:
+        lat, lon = float(form["lat"]), float(form["lon"])
+    except (KeyError, ValueError):
+        lat = lon = None
 
     if not title or not desc or not photo:
         return jsonify({"message": "Missing required fields (title, description, or photo)"}), 400
 
-    safe_name = secure_filename(photo.filename or "report.jpg")
-    ext = os.path.splitext(safe_name)[1] or ".jpg"
-    stored_name = f"{uuid4().hex}{ext}"
-    
-    try:
-        photo.save(os.path.join(IMAGES_DIR, stored_name))
-    except Exception as e:
-        print(f"ERROR: Failed to save photo: {e}")
-        return jsonify({"message": f"Failed to save photo: {e}"}), 500
+    # The stored name is derived from the content hash, so no part of the
+    # user-supplied filename ever reaches disk — secure_filename would
+    # sanitize a string we discard anyway. One splitext pass for the extension.
+    ext = os.path.splitext(photo.filename or "")[1].lower()
+    # Only store known image extensions; anything else falls back to .jpg.
+    if ext not in _ALLOWED_EXT:
+        ext = ".jpg"
 
+    # Read the (size-capped) upload while the request stream is still alive.
+    # Content-addressed name: re-uploads of the same photo dedupe to one file
+    # on disk, and the background writer can skip the write entirely.
+    payload = photo.stream.read()
+    stored_name = f"{hashlib.sha256(payload).hexdigest()}{ext}"
 
     doc = {
         "type": "report",
@@ -506,30 +698,36 @@ def create_report_file():
         "description": desc,
         "category": cat if cat in ALL_CATEGORIES else "infrastructure",
         "image": stored_name,
-        "createdAt": datetime.now(timezone.utc).isoformat(),
+        "createdAt": datetime.now(timezone.utc),  # BSON Date: 8 bytes, range-indexable
     }
 
-    if lat and lon:
-        try:
-            doc["latitude"] = float(lat)
-            doc["longitude"] = float(lon)
-        except ValueError:
-            pass
-    
+    if lat is not None and lon is not None:
+        doc["latitude"] = lat
+        doc["longitude"] = lon
+
+    # The insert stays synchronous — milliseconds with w=1/j=False, and a
+    # failure must surface to the client instead of silently dropping the
+    # report. Only the image write (the slow, retry-safe part) is offloaded;
+    # 202 because the photo bytes may still be in flight to disk.
     try:
-        collection.insert_one(doc)
-        return jsonify({"message": "Report saved", "imagePath": f"/images/{stored_name}"}), 201
+        reportsWriteCollection.insert_one(doc)
     except Exception as e:
-        print(f"ERROR: Failed to insert report document: {e}")
-        return jsonify({"message": f"DB error: {e}"}), 500
+        logger.error("Failed to insert report: %s", e)
+        return jsonify({"error": "Failed to save report"}), 500
+    _EXECUTOR.submit(_save_photo, payload, f"{_IMAGES_DIR}/{stored_name}")
+    return jsonify({"message": "Report accepted", "imagePath": f"/images/{stored_name}"}), 202
 
 
 @app.route("/images/<path:filename>", methods=["GET", "OPTIONS"])
 def serve_image(filename):
-    if request.method == 'OPTIONS':
-        return '', 200
     
-    return send_from_directory(IMAGES_DIR, filename)
+    # Stored names are content hashes, so the content behind a URL never
+    # changes — cache for a year and mark immutable so well-behaved clients
+    # skip even the revalidation probe; conditional=True still answers any
+    # If-Modified-Since with a 304 instead of re-sending bytes.
+    resp = send_from_directory(IMAGES_DIR, filename, conditional=True, max_age=31536000)
+    resp.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return resp
 
 # ======================================================================
 # 7. RUN APP
@@ -540,4 +738,6 @@ if __name__ == "__main__":
     if not os.path.exists(IMAGES_DIR):
         os.makedirs(IMAGES_DIR)
     
-    app.run(port=5000, debug=True)
\ No newline at end of file
+    # Dev entry point only — production runs under gunicorn (gunicorn.conf.py)
+    # so concurrent requests can overlap their blocking Meersens/Mongo I/O.
+    app.run(port=5000, debug=os.getenv("FLASK_DEBUG", "1") == "1")
\ No newline at end of file
@@ -0,0 +1,20 @@
+# Production server config. The hot endpoints block on outbound HTTP
+# (Meersens) and MongoDB, so threaded workers let those waits overlap
+# instead of serializing behind the single-threaded dev server.
+#
+# Run with:  gunicorn -c gunicorn.conf.py app:app
+#
+# gthread was chosen over gevent deliberately: it needs no monkey-patching
+# of requests/pymongo, and 32 threads comfortably covers the concurrency the
+# Meersens rate limits allow. Revisit gevent only if thread count becomes
+# the bottleneck.
+#
+# A full ASGI port (Quart/motor/aiohttp) was also considered and rejected:
+# it would rewrite every route and swap both client libraries for a
+# concurrency ceiling this traffic never approaches, and the per-fetcher
+# TTL caches already absorb most upstream waits.
+bind = "0.0.0.0:5000"
+workers = 2
+worker_class = "gthread"
+threads = 16
+timeout = 30
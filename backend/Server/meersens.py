@@ -0,0 +1,265 @@
+"""Meersens API client: pooled HTTP session plus air-quality and weather scoring.
+
+Single source of truth for the Meersens code that previously existed in
+diverging copies across app.py / weather.py — app.py just imports the score
+functions from here, and the pooled session/caches are defined exactly once.
+"""
+import bisect
+import functools
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, Tuple
+from urllib.parse import urlencode
+
+import cachetools
+import orjson
+import requests
+from dotenv import load_dotenv
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+API_KEY = os.getenv('MEERSENS_API_KEY')
+if not API_KEY:
+    logger.warning("MEERSENS_API_KEY is not set. API calls will likely fail.")
+
+AIR_URL = "https://api.meersens.com/environment/public/air/current"
+WEATHER_URL = "https://api.meersens.com/environment/public/weather/current"
+
+DEFAULT_SCORE = 5.5
+DEFAULT_DESCRIPTION = "Data unavailable"
+
+class MeersensUnavailable(Exception):
+    """Raised when a score cannot be fetched right now (missing API key, open
+    circuit breaker, transport failure).
+
+    Raised out of the cached fetchers on purpose: cachetools does not store
+    results for calls that raise, so fallback defaults are never pinned in
+    the TTL caches and the next request retries the upstream. Callers map
+    this to their default score."""
+
+# Shared HTTP session for all Meersens calls. Keep-alive + connection pooling
+# means repeat requests reuse the same TLS socket instead of paying a fresh
+# TCP + TLS handshake per call. Headers are set once here, not per request.
+# (air_api_fetcher.py keeps its own session the same way for CLI use; no
+# bare requests.get() should appear anywhere in the backend.)
+class _JitteredRetry(Retry):
+    """Retry whose backoff carries uniform jitter (x1.0-1.5, capped at 30s).
+
+    Deterministic exponential backoff makes every worker that failed together
+    retry together, hammering the upstream in lockstep; the jitter
+    decorrelates them.
+    """
+
+    def get_backoff_time(self):
+        return min(super().get_backoff_time() * (1.0 + random.random() * 0.5), 30.0)
+
+_SESSION = requests.Session()
+_SESSION.headers.update({'Accept': 'application/json'})
+if API_KEY:
+    _SESSION.headers['apikey'] = API_KEY
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    # Short, bounded retry for transient upstream errors only; the caller's
+    # default-score fallback handles anything beyond that.
+    max_retries=_JitteredRetry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504)),
+))
+
+# (connect, read) timeout for Meersens calls; fail fast on connect, allow slow reads.
+_MEERSENS_TIMEOUT = (3.05, 10)
+
+class _CircuitBreaker:
+    """In-process circuit breaker for one upstream host.
+
+    Closed is normal operation; after `failure_threshold` consecutive
+    transport failures the breaker opens and allow() fails fast, so an
+    outage costs microseconds instead of a full timeout+retry cycle per
+    request. After `reset_timeout` seconds probe calls are let through
+    (half-open): one success closes the breaker, a failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = 0.0
+        self._state = "closed"
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == "open":
+                if time.monotonic() - self._opened_at < self._reset_timeout:
+                    return False
+                self._state = "half_open"
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != "closed":
+                logger.info("Meersens circuit breaker closed again.")
+            self._failures = 0
+            self._state = "closed"
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == "half_open" or self._failures >= self._failure_threshold:
+                if self._state != "open":
+                    logger.warning("Meersens circuit breaker opened after %d failures.", self._failures)
+                self._state = "open"
+                self._opened_at = time.monotonic()
+
+# Both endpoints live on api.meersens.com, so one breaker covers them.
+_MEERSENS_BREAKER = _CircuitBreaker()
+
+# Cache scores per ~100m cell (coordinates rounded to 3 decimals) so burst
+# traffic for the same spot costs one upstream call per TTL window. Air
+# quality drifts slower than weather, hence the longer TTL. Only successful
+# lookups are stored — failures raise MeersensUnavailable past the cache.
+# Note: these caches are per-process; under multi-worker gunicorn each worker
+# warms its own. Swap for a shared backend (e.g. Redis) if that ever matters.
+_AIR_CACHE = cachetools.TTLCache(maxsize=4096, ttl=1800)
+_WEATHER_CACHE = cachetools.TTLCache(maxsize=4096, ttl=900)
+
+def _coord_key(lat: float, lon: float) -> Tuple[float, float]:
+    return (round(lat, 3), round(lon, 3))
+
+def _coord_qs(lat: float, lng: float) -> str:
+    # Both endpoints take the same lat/lng query, so encode it once here and
+    # append it to the URL directly — requests then skips its PreparedRequest
+    # param-encoding pass on every upstream call.
+    return urlencode({"lat": lat, "lng": lng})
+
+# ======================================================================
+# AIR QUALITY
+# ======================================================================
+
+def _scale_maqi_to_score(maqi_value: float) -> float:
+    # Linear map of MAQI 0..100 (best..worst) onto a 10..1 quality score.
+    # Constants are inlined: slope = -9/100 = -0.09, intercept = 10.0.
+    # All callers are scalar today; if a batch rescore job ever appears this
+    # becomes one NumPy pass: np.clip(10.0 - 0.09*np.clip(a,0,100),1,10).round(1)
+    # Deliberately not lru_cached: the TTL caches above already memoize the
+    # callers per coordinate cell, and a dict probe costs more than this math.
+    v = 0.0 if maqi_value < 0.0 else (100.0 if maqi_value > 100.0 else maqi_value)
+    return round(10.0 - 0.09 * v, 1)
+
+@cachetools.cached(_AIR_CACHE, key=_coord_key, lock=threading.Lock())
+def get_air_quality_score(latitude: float, longitude: float) -> Tuple[float, str]:
+    logger.debug("Fetching Air Quality for %s,%s", latitude, longitude)
+    if not API_KEY:
+        raise MeersensUnavailable("MEERSENS_API_KEY is not set")
+    if not _MEERSENS_BREAKER.allow():
+        raise MeersensUnavailable("circuit breaker is open")
+
+    try:
+        resp = _SESSION.get(f"{AIR_URL}?{_coord_qs(latitude, longitude)}", timeout=_MEERSENS_TIMEOUT)
+        if resp.status_code >= 400:
+            resp.raise_for_status()
+    except requests.RequestException as e:
+        _MEERSENS_BREAKER.record_failure()
+        logger.error("Air Quality API failed: %s", e)
+        raise MeersensUnavailable(f"air request failed: {e}") from e
+    _MEERSENS_BREAKER.record_success()
+    data = orjson.loads(resp.content)
+    if data.get('found'):
+        idx = data.get('index', {})
+        if idx.get('value') is not None:
+            score = _scale_maqi_to_score(float(idx['value']))
+            desc = f"Air: {idx.get('qualification', 'Unknown')}"
+            return score, desc
+    # A 200 with no index for this cell is a genuine answer — the upstream is
+    # healthy and simply has no data here — so caching the default is correct.
+    return DEFAULT_SCORE, f"Air: {DEFAULT_DESCRIPTION}"
+
+# ======================================================================
+# WEATHER
+# ======================================================================
+
+def get_weather_data(lat: float, lng: float):
+    # Module-level (not a method) so the cached score layer below is shared
+    # across requests; the fetch uses no per-instance state anyway.
+    r = _SESSION.get(f"{WEATHER_URL}?{_coord_qs(lat, lng)}", timeout=_MEERSENS_TIMEOUT)
+    if r.status_code >= 400:
+        r.raise_for_status()
+    return orjson.loads(r.content)
+
+# Temperature bands for descriptions: one binary search into the label table
+# instead of a comparison ladder, and trivial to extend with more bands.
+_TEMP_BREAKS = (0, 10, 20, 28, 35)
+_TEMP_LABELS = ("Freezing", "Cold", "Cool", "Pleasant", "Warm", "Hot")
+
+# One pre-formatted template per band, built at import: the per-call work is
+# a table lookup plus a single %-format with the two dynamic values.
+_DESC_TEMPLATES = tuple(f"Weather: %s, {label} (%s°C)" for label in _TEMP_LABELS)
+
+@functools.lru_cache(maxsize=64)
+def _title_condition(condition: str) -> str:
+    # Meersens returns a small fixed vocabulary of condition strings, so the
+    # title-cased form is computed once per distinct value, not per request.
+    return condition.title()
+
+# Points-per-degree of deviation, hoisted so the rating is one multiply
+# instead of a divide + multiply per call: 10/65 ≈ 0.1538.
+_WEATHER_SCALE = 10.0 / 65.0
+
+class WeatherService:
+    OPTIMAL_TEMP = 25.0
+
+    def calculate_weather_rating(self, data: Dict[str, Any]) -> float:
+        # EAFP extraction: on the hot path (key present) plain subscripts are
+        # cheaper than three .get calls allocating empty-dict fallbacks.
+        try:
+            temp = data["parameters"]["temperature"]["value"]
+        except (KeyError, TypeError):
+            temp = None
+        if temp is None:
+            return DEFAULT_SCORE
+        deviation = abs(temp - self.OPTIMAL_TEMP)
+        # Plain branch instead of max(): skips a builtin call + tuple per score.
+        rating = 10.0 - deviation * _WEATHER_SCALE
+        if rating < 1.0:
+            rating = 1.0
+        return round(rating, 1)
+
+    def describe_weather(self, data: Dict[str, Any]) -> str:
+        params = data.get("parameters") or {}
+        try:
+            temp = params["temperature"]["value"]
+        except (KeyError, TypeError):
+            temp = None
+        try:
+            condition = _title_condition(params["weather_condition"]["value"])
+        except (KeyError, TypeError, AttributeError):
+            condition = "Unknown"
+        if temp is None:
+            return f"Weather: {condition}"
+        return _DESC_TEMPLATES[bisect.bisect_right(_TEMP_BREAKS, temp)] % (condition, temp)
+
+# The service is stateless, so one shared instance is enough.
+_WEATHER_SERVICE = WeatherService()
+
+@cachetools.cached(_WEATHER_CACHE, key=_coord_key, lock=threading.Lock())
+def get_weather_score(lat: float, lon: float) -> Tuple[float, str]:
+    logger.debug("Fetching Weather for %s,%s", lat, lon)
+    service = _WEATHER_SERVICE
+    if not API_KEY:
+        raise MeersensUnavailable("MEERSENS_API_KEY is not set")
+    if not _MEERSENS_BREAKER.allow():
+        raise MeersensUnavailable("circuit breaker is open")
+    try:
+        data = get_weather_data(lat, lon)
+    except requests.RequestException as e:
+        _MEERSENS_BREAKER.record_failure()
+        logger.error("Weather API failed: %s", e)
+        raise MeersensUnavailable(f"weather request failed: {e}") from e
+    _MEERSENS_BREAKER.record_success()
+    score = service.calculate_weather_rating(data)
+    desc = service.describe_weather(data)
+    return score, desc
@@ -1,11 +1,15 @@
 REPORT_CATEGORIES = ["disaster", "infrastructure", "safety"]
 
+# Frozen view for membership tests: one hash lookup instead of a list scan,
+# and immutable so it is safe to share across threads.
+REPORT_CATEGORY_SET = frozenset(REPORT_CATEGORIES)
+
 REPORT_SCHEMA = {
     # Title (string, required)
     "title": {"type": str, "required": True},
     
     # Category (string, required, must be one of the predefined list)
-    "category": {"type": str, "required": True, "allowed_values": REPORT_CATEGORIES},
+    "category": {"type": str, "required": True, "allowed_values": REPORT_CATEGORY_SET},
     
     # Description (string, required)
     "description": {"type": str, "required": True},
@@ -33,5 +37,5 @@ REPORT_SCHEMA = {
     "imagelink": {"type": str, "required": False, "default": ""},
 }
 
-# The categories list is exported for easy reference
-ALL_CATEGORIES = REPORT_CATEGORIES
\ No newline at end of file
+# Exported for easy reference; the set form since callers only test membership
+ALL_CATEGORIES = REPORT_CATEGORY_SET
\ No newline at end of file
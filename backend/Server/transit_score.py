@@ -1,3 +1,5 @@
+import bisect
+import functools
 import math
 from typing import Tuple
 
@@ -5,72 +7,71 @@ from typing import Tuple
 CALGARY_DOWNTOWN_LAT = 51.045
 CALGARY_DOWNTOWN_LNG = -114.075
 
-def _haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+# Scaling parameters: score 10 at 0 km down to score 2 at the 15 km clamp.
+# The slope (points per km) is computed once here, not per call.
+_MAX_DISTANCE_KM = 15.0
+_SCORE_SLOPE = (2.0 - 10.0) / _MAX_DISTANCE_KM
+
+# Access-quality bands keyed by score: one binary search into the label
+# table instead of a comparison ladder, same pattern as the temperature
+# bands in meersens.py.
+_ACCESS_BREAKS = (6.0, 8.5)
+_ACCESS_LABELS = (
+    "Limited Access (Suburban/Car Dependent)",
+    "Good Access (Main Bus Route Coverage)",
+    "Excellent Access (Walkable to LRT)",
+)
+
+# Constants for the equirectangular distance below, resolved at import time.
+_COS_LAT0 = math.cos(math.radians(CALGARY_DOWNTOWN_LAT))
+_DEG2KM = math.pi / 180.0 * 6371.0  # km per degree of arc
+
+def _distance_to_downtown(latitude: float, longitude: float) -> float:
     """
-    Calculates the great-circle distance (in km) between two points on Earth 
-    using the Haversine formula.
+    Calculates the distance (in km) from a point to the downtown Calgary hub
+    using the equirectangular approximation.
+
+    The score clamps at 15 km, and within that radius at Calgary's latitude
+    this is accurate to well under 0.1% of the full Haversine great-circle
+    formula — without any per-call trig (the one cosine is a module constant).
     """
-    R = 6371 # Earth radius in km
-    
-    lat1_rad = math.radians(lat1)
-    lon1_rad = math.radians(lon1)
-    lat2_rad = math.radians(lat2)
-    lon2_rad = math.radians(lon2)
-    
-    dlon = lon2_rad - lon1_rad
-    dlat = lat2_rad - lat1_rad
-    
-    a = math.sin(dlat / 2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2)**2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    
-    distance_km = R * c
-    return distance_km
+    dlat = latitude - CALGARY_DOWNTOWN_LAT
+    dlon = (longitude - CALGARY_DOWNTOWN_LNG) * _COS_LAT0
+    return _DEG2KM * math.sqrt(dlat * dlat + dlon * dlon)
 
 def get_transit_score(latitude: float, longitude: float) -> Tuple[float, str]:
     """
-    Simulates a Transit Accessibility score (1-10) based on proximity to the 
+    Simulates a Transit Accessibility score (1-10) based on proximity to the
     Calgary downtown core (major transit hub).
-    
+
     Args:
         latitude (float): The target location's latitude.
         longitude (float): The target location's longitude.
-        
+
     Returns:
         Tuple[float, str]: The accessibility score and a descriptive string.
     """
-    
+    # Memoized on ~100m cells (same rounding as the meersens caches): the
+    # score is pure, so repeat queries near a known point are one dict hit.
+    return _transit_score_cached(round(latitude, 3), round(longitude, 3))
+
+@functools.lru_cache(maxsize=4096)
+def _transit_score_cached(latitude: float, longitude: float) -> Tuple[float, str]:
     # 1. Calculate distance to the central transit hub
-    distance_km = _haversine_distance(
-        latitude, 
-        longitude, 
-        CALGARY_DOWNTOWN_LAT, 
-        CALGARY_DOWNTOWN_LNG
-    )
-    
-    # 2. Define scaling parameters:
-    # Score 10 is at 0km. Score 2.0 is at 15km.
-    MAX_DISTANCE_KM = 15.0 
-    SCORE_MAX = 10.0
-    SCORE_MIN = 2.0
+    distance_km = _distance_to_downtown(latitude, longitude)
     
-    clamped_distance_km = min(distance_km, MAX_DISTANCE_KM)
+    # 2. Linear scaling: score decreases as distance increases, using the
+    # slope and clamp constants hoisted to module scope above.
+    clamped_distance_km = min(distance_km, _MAX_DISTANCE_KM)
+    score = 10.0 + clamped_distance_km * _SCORE_SLOPE
 
-    # Linear scaling: Score decreases as distance increases
-    # Slope = (SCORE_MIN - SCORE_MAX) / MAX_DISTANCE_KM 
-    score = SCORE_MAX + (clamped_distance_km * (SCORE_MIN - SCORE_MAX) / MAX_DISTANCE_KM)
-    
     # Ensure score is never below 1.0 (the absolute minimum)
     score = max(1.0, score)
     score = round(score, 1)
     
     # 3. Generate Description
-    if score >= 8.5:
-        desc_qualifier = "Excellent Access (Walkable to LRT)"
-    elif score >= 6.0:
-        desc_qualifier = "Good Access (Main Bus Route Coverage)"
-    else:
-        desc_qualifier = "Limited Access (Suburban/Car Dependent)"
-            
+    desc_qualifier = _ACCESS_LABELS[bisect.bisect_right(_ACCESS_BREAKS, score)]
+
     description = f"Transit: {desc_qualifier} ({distance_km:.1f} km from downtown)"
     
     return score, description